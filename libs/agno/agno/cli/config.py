@@ -10,6 +10,20 @@ from agno.utils.json_io import read_json_file, write_json_file
 from agno.utils.log import logger
 from agno.workspace.config import WorkspaceConfig
 
+# Process-level cache of the saved config, populated on the first read and
+# kept in sync by save_config so repeat loads skip the json parse. The mtime
+# of the config file is stored alongside so an external change to the file
+# invalidates the cached object.
+_saved_config: Optional["AgnoCliConfig"] = None
+_saved_config_mtime_ns: Optional[int] = None
+
+
+def _config_file_mtime_ns() -> Optional[int]:
+    try:
+        return agno_cli_settings.config_file_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class AgnoCliConfig:
     """The AgnoCliConfig class manages user data for the agno cli"""
@@ -27,6 +41,9 @@ class AgnoCliConfig:
         # Active ws dir - used as the default for `ag` commands
         # To add an active workspace, use the active_ws_dir setter
         self._active_ws_dir: Optional[str] = active_ws_dir
+        # Path form of the active ws dir, cached to avoid re-stringifying
+        # Path objects when comparing against workspace roots
+        self._active_ws_dir_path: Optional[Path] = Path(active_ws_dir) if active_ws_dir else None
 
         # Mapping from ws_root_path to ws_config
         self.ws_config_map: Dict[str, WorkspaceConfig] = ws_config_map or OrderedDict()
@@ -59,6 +76,7 @@ class AgnoCliConfig:
         logger.debug("Clearing user cache")
         self.ws_config_map.clear()
         self._active_ws_dir = None
+        self._active_ws_dir_path = None
         agno_cli_settings.ai_conversations_path.unlink(missing_ok=True)
         logger.info("Workspaces cleared. If applicable, please setup your workspace using `ag ws setup`")
 
@@ -70,10 +88,15 @@ class AgnoCliConfig:
     def active_ws_dir(self) -> Optional[str]:
         return self._active_ws_dir
 
+    @property
+    def active_ws_dir_path(self) -> Optional[Path]:
+        return self._active_ws_dir_path
+
     def set_active_ws_dir(self, ws_root_path: Optional[Path]) -> None:
         if ws_root_path is not None:
             logger.debug(f"Setting active workspace to: {str(ws_root_path)}")
             self._active_ws_dir = str(ws_root_path)
+            self._active_ws_dir_path = ws_root_path
             self.save_config()
 
     @property
@@ -167,6 +190,7 @@ class AgnoCliConfig:
         )
         if set_as_active:
             self._active_ws_dir = str(ws_root_path)
+            self._active_ws_dir_path = ws_root_path
         self.save_config()
         return ws_config
 
@@ -185,6 +209,7 @@ class AgnoCliConfig:
         if self._active_ws_dir is not None and self._active_ws_dir == ws_root_str:
             print_info(f"Removing {ws_root_str} as the active workspace")
             self._active_ws_dir = None
+            self._active_ws_dir_path = None
         self.save_config()
         print_info("Workspace record deleted")
         print_info("Note: this does not delete any data locally or from agno.com, please delete them manually\n")
@@ -214,15 +239,24 @@ class AgnoCliConfig:
     ######################################################
 
     def save_config(self):
+        global _saved_config, _saved_config_mtime_ns
+
         config_data = {
             "user": self.user.model_dump() if self.user else None,
             "active_ws_dir": self.active_ws_dir,
             "ws_config_map": {k: v.to_dict() for k, v in self.ws_config_map.items()},
         }
         write_json_file(file_path=agno_cli_settings.config_file_path, data=config_data)
+        _saved_config = self
+        _saved_config_mtime_ns = _config_file_mtime_ns()
 
     @classmethod
     def from_saved_config(cls) -> Optional["AgnoCliConfig"]:
+        global _saved_config, _saved_config_mtime_ns
+
+        mtime_ns = _config_file_mtime_ns()
+        if _saved_config is not None and mtime_ns == _saved_config_mtime_ns:
+            return _saved_config
         try:
             config_data = read_json_file(file_path=agno_cli_settings.config_file_path)
             if config_data is None or not isinstance(config_data, dict):
@@ -241,6 +275,8 @@ class AgnoCliConfig:
                 _ws_config = WorkspaceConfig.model_validate(v)
                 if _ws_config is not None:
                     new_config.ws_config_map[k] = _ws_config
+            _saved_config = new_config
+            _saved_config_mtime_ns = mtime_ns
             return new_config
         except Exception as e:
             logger.warning(e)
@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from agno.cli.ws.ws_cli import ws_cli
+
+__all__ = ["ws_cli"]
+
+
+def __getattr__(name: str):
+    # Lazily import ws_cli so importing this package does not pull in
+    # typer (and transitively click/rich) until the cli is actually used
+    if name == "ws_cli":
+        from agno.cli.ws.ws_cli import ws_cli
+
+        globals()[name] = ws_cli
+        return ws_cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
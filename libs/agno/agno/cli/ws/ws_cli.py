@@ -3,10 +3,16 @@
 This is the entrypoint for the `agno ws` application.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, cast
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 import typer
+from typing_extensions import Annotated
+
+if TYPE_CHECKING:
+    from agno.cli.config import AgnoCliConfig
+    from agno.workspace.config import WorkspaceConfig
 
 from agno.cli.console import (
     log_active_workspace_not_available,
@@ -30,6 +36,173 @@ Run `ag ws [COMMAND] --help` for more info.
     subcommand_metavar="[COMMAND] [OPTIONS]",
 )
 
+# Shared argument/option definitions for the resource commands.
+# Declaring these once lets typer build a single OptionInfo per option at
+# import time instead of one per command.
+ResourceFilterArgument = Annotated[
+    Optional[str], typer.Argument(help="Resource filter. Format - ENV:INFRA:GROUP:NAME:TYPE")
+]
+EnvFilterOption = Annotated[Optional[str], typer.Option("-e", "--env", metavar="", help="Filter the environment.")]
+InfraFilterOption = Annotated[Optional[str], typer.Option("-i", "--infra", metavar="", help="Filter the infra.")]
+GroupFilterOption = Annotated[
+    Optional[str], typer.Option("-g", "--group", metavar="", help="Filter resources using group name.")
+]
+NameFilterOption = Annotated[
+    Optional[str], typer.Option("-n", "--name", metavar="", help="Filter resource using name.")
+]
+TypeFilterOption = Annotated[Optional[str], typer.Option("-t", "--type", metavar="", help="Filter resource using type")]
+DryRunOption = Annotated[bool, typer.Option("-dr", "--dry-run", help="Print resources and exit.")]
+AutoConfirmOption = Annotated[bool, typer.Option("-y", "--yes", help="Skip confirmation before applying the action.")]
+PrintDebugLogOption = Annotated[bool, typer.Option("-d", "--debug", help="Print debug logs.")]
+ForceOption = Annotated[Optional[bool], typer.Option("-f", "--force", help="Force the action where applicable.")]
+PullOption = Annotated[Optional[bool], typer.Option("-p", "--pull", help="Pull images where applicable.")]
+
+
+@ws_cli.callback()
+def ws_callback(
+    print_debug_log: PrintDebugLogOption = False,
+):
+    """Configure logging once before dispatching to a subcommand."""
+    if print_debug_log:
+        set_log_level_to_debug()
+
+
+@lru_cache(maxsize=1)
+def _current_path() -> Path:
+    """The working directory, resolved once per process; the cli never chdirs."""
+    return Path.cwd()
+
+
+def _derive_targets(
+    resource_filter: Optional[str],
+    env_filter: Optional[str],
+    infra_filter: Optional[str],
+    group_filter: Optional[str],
+    name_filter: Optional[str],
+    type_filter: Optional[str],
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Derive the (env, infra, group, name, type) targets for a command.
+
+    The resource filter takes precedence, followed by the command options.
+    Typer already enforces that all arguments are Optional[str].
+    """
+    if resource_filter is None:
+        parsed: Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]] = (
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+    elif ":" not in resource_filter:
+        # Fast path for the common `ag ws up dev` case: a single token is the env
+        parsed = (resource_filter or None, None, None, None, None)
+    else:
+        from agno.utils.resource_filter import parse_resource_filter
+
+        parsed = parse_resource_filter(resource_filter)
+    overrides = (env_filter, infra_filter, group_filter, name_filter, type_filter)
+    target_env, target_infra, target_group, target_name, target_type = (
+        parsed_value if parsed_value is not None else override for parsed_value, override in zip(parsed, overrides)
+    )
+    return target_env, target_infra, target_group, target_name, target_type
+
+
+def _resolve_ws_config(agno_config: "AgnoCliConfig", current_path: Path) -> Optional["WorkspaceConfig"]:
+    """Resolve the workspace a command should act on.
+
+    Candidates in order: an existing workspace at the current path, a workspace
+    set up from a `workspace` dir at the current path, the active workspace.
+    """
+    from agno.workspace.helpers import get_workspace_dir_path
+    from agno.workspace.operator import setup_workspace
+
+    def _ws_at_current_path() -> Optional["WorkspaceConfig"]:
+        ws_config = agno_config.get_ws_config_by_path(current_path)
+        if ws_config is not None:
+            logger.debug(f"Found workspace at: {ws_config.ws_root_path}")
+            if ws_config.ws_root_path != agno_config.active_ws_dir_path:
+                logger.debug(f"Updating active workspace to {ws_config.ws_root_path}")
+                agno_config.set_active_ws_dir(ws_config.ws_root_path)
+        return ws_config
+
+    def _ws_from_workspace_dir() -> Optional["WorkspaceConfig"]:
+        workspace_ws_dir_path = get_workspace_dir_path(current_path)
+        if workspace_ws_dir_path is None:
+            return None
+        logger.debug(f"Found workspace directory: {workspace_ws_dir_path}")
+        logger.debug(f"Setting up a workspace at: {current_path}")
+        ws_config = setup_workspace(ws_root_path=current_path)
+        print_info("")
+        return ws_config
+
+    candidates = (
+        _ws_at_current_path,
+        _ws_from_workspace_dir,
+        agno_config.get_active_ws_config,
+    )
+    return next((ws_config for ws_config in (candidate() for candidate in candidates) if ws_config is not None), None)
+
+
+def _resolve_ws_and_targets(
+    resource_filter: Optional[str],
+    env_filter: Optional[str],
+    infra_filter: Optional[str],
+    group_filter: Optional[str],
+    name_filter: Optional[str],
+    type_filter: Optional[str],
+) -> Tuple[
+    Optional["AgnoCliConfig"],
+    Optional["WorkspaceConfig"],
+    Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]],
+]:
+    """Loads the cli config, resolves the workspace to act on and derives the targets.
+
+    Shared by the up/down/patch commands. Logs the relevant error and returns a
+    None config or workspace when either is unavailable.
+    """
+    from agno.cli.config import AgnoCliConfig
+    from agno.cli.operator import initialize_agno
+
+    empty_targets: Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]] = (
+        None,
+        None,
+        None,
+        None,
+        None,
+    )
+
+    agno_config: Optional[AgnoCliConfig] = AgnoCliConfig.from_saved_config()
+    if not agno_config:
+        agno_config = initialize_agno()
+        if not agno_config:
+            log_config_not_available_msg()
+            return None, None, empty_targets
+
+    ws_config = _resolve_ws_config(agno_config, _current_path())
+
+    # If there's no workspace to act on, raise an error showing available workspaces
+    if ws_config is None:
+        log_active_workspace_not_available()
+        if agno_config.ws_config_map:
+            print_available_workspaces(agno_config.available_ws)
+        return agno_config, None, empty_targets
+
+    # derive env:infra:group:name:type from the resource filter and command options
+    target_env, target_infra, target_group, target_name, target_type = _derive_targets(
+        resource_filter, env_filter, infra_filter, group_filter, name_filter, type_filter
+    )
+
+    # derive env:infra from the workspace settings defaults
+    workspace_settings = ws_config.workspace_settings
+    if workspace_settings is not None:
+        if target_env is None:
+            target_env = workspace_settings.default_env
+        if target_infra is None:
+            target_infra = workspace_settings.default_infra
+
+    return agno_config, ws_config, (target_env, target_infra, target_group, target_name, target_type)
+
 
 @ws_cli.command(short_help="Create a new workspace in the current directory.")
 def create(
@@ -54,12 +227,7 @@ def create(
         help="URL of the starter template.",
         show_default=False,
     ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
+    print_debug_log: PrintDebugLogOption = False,
 ):
     """\b
     Create a new workspace in the current directory using a starter template or url
@@ -83,12 +251,7 @@ def setup(
         help="Path to workspace [default: current directory]",
         show_default=False,
     ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
+    print_debug_log: PrintDebugLogOption = False,
 ):
     """\b
     Setup a workspace. This command can be run from the workspace directory OR using the workspace path.
@@ -103,63 +266,27 @@ def setup(
     from agno.workspace.operator import setup_workspace
 
     # By default, we assume this command is run from the workspace directory
-    ws_root_path: Path = Path(".").resolve()
+    ws_root_path: Path = _current_path()
 
     # If the user provides a path, use that to setup the workspace
     if path is not None:
-        ws_root_path = Path(".").joinpath(path).resolve()
+        ws_root_path = Path(path).resolve()
     setup_workspace(ws_root_path=ws_root_path)
 
 
 @ws_cli.command(short_help="Create resources for the active workspace")
 def up(
-    resource_filter: Optional[str] = typer.Argument(
-        None,
-        help="Resource filter. Format - ENV:INFRA:GROUP:NAME:TYPE",
-    ),
-    env_filter: Optional[str] = typer.Option(None, "-e", "--env", metavar="", help="Filter the environment to deploy."),
-    infra_filter: Optional[str] = typer.Option(None, "-i", "--infra", metavar="", help="Filter the infra to deploy."),
-    group_filter: Optional[str] = typer.Option(
-        None, "-g", "--group", metavar="", help="Filter resources using group name."
-    ),
-    name_filter: Optional[str] = typer.Option(None, "-n", "--name", metavar="", help="Filter resource using name."),
-    type_filter: Optional[str] = typer.Option(
-        None,
-        "-t",
-        "--type",
-        metavar="",
-        help="Filter resource using type",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "-dr",
-        "--dry-run",
-        help="Print resources and exit.",
-    ),
-    auto_confirm: bool = typer.Option(
-        False,
-        "-y",
-        "--yes",
-        help="Skip confirmation before deploying resources.",
-    ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
-    force: Optional[bool] = typer.Option(
-        None,
-        "-f",
-        "--force",
-        help="Force create resources where applicable.",
-    ),
-    pull: Optional[bool] = typer.Option(
-        None,
-        "-p",
-        "--pull",
-        help="Pull images where applicable.",
-    ),
+    resource_filter: ResourceFilterArgument = None,
+    env_filter: EnvFilterOption = None,
+    infra_filter: InfraFilterOption = None,
+    group_filter: GroupFilterOption = None,
+    name_filter: NameFilterOption = None,
+    type_filter: TypeFilterOption = None,
+    dry_run: DryRunOption = False,
+    auto_confirm: AutoConfirmOption = False,
+    print_debug_log: PrintDebugLogOption = False,
+    force: ForceOption = None,
+    pull: PullOption = None,
 ):
     """\b
     Create resources for the active workspace
@@ -182,94 +309,15 @@ def up(
     if print_debug_log:
         set_log_level_to_debug()
 
-    from agno.cli.config import AgnoCliConfig
-    from agno.cli.operator import initialize_agno
-    from agno.utils.resource_filter import parse_resource_filter
-    from agno.workspace.config import WorkspaceConfig
-    from agno.workspace.helpers import get_workspace_dir_path
-    from agno.workspace.operator import setup_workspace, start_workspace
-
-    agno_config: Optional[AgnoCliConfig] = AgnoCliConfig.from_saved_config()
-    if not agno_config:
-        agno_config = initialize_agno()
-        if not agno_config:
-            log_config_not_available_msg()
-            return
-    agno_config = cast(AgnoCliConfig, agno_config)
+    from agno.workspace.operator import start_workspace
 
     # Workspace to start
-    ws_to_start: Optional[WorkspaceConfig] = None
-
-    # If there is an existing workspace at current path, use that workspace
-    current_path: Path = Path(".").resolve()
-    ws_at_current_path: Optional[WorkspaceConfig] = agno_config.get_ws_config_by_path(current_path)
-    if ws_at_current_path is not None:
-        logger.debug(f"Found workspace at: {ws_at_current_path.ws_root_path}")
-        if str(ws_at_current_path.ws_root_path) != agno_config.active_ws_dir:
-            logger.debug(f"Updating active workspace to {ws_at_current_path.ws_root_path}")
-            agno_config.set_active_ws_dir(ws_at_current_path.ws_root_path)
-        ws_to_start = ws_at_current_path
-
-    # If there's no existing workspace at current path, check if there's a `workspace` dir in the current path
-    # In that case setup the workspace
-    if ws_to_start is None:
-        workspace_ws_dir_path = get_workspace_dir_path(current_path)
-        if workspace_ws_dir_path is not None:
-            logger.debug(f"Found workspace directory: {workspace_ws_dir_path}")
-            logger.debug(f"Setting up a workspace at: {current_path}")
-            ws_to_start = setup_workspace(ws_root_path=current_path)
-            print_info("")
-
-    # If there's no workspace at current path, check if an active workspace exists
-    if ws_to_start is None:
-        active_ws_config: Optional[WorkspaceConfig] = agno_config.get_active_ws_config()
-        # If there's an active workspace, use that workspace
-        if active_ws_config is not None:
-            ws_to_start = active_ws_config
-
-    # If there's no workspace to start, raise an error showing available workspaces
-    if ws_to_start is None:
-        log_active_workspace_not_available()
-        avl_ws = agno_config.available_ws
-        if avl_ws:
-            print_available_workspaces(avl_ws)
+    agno_config, ws_to_start, targets = _resolve_ws_and_targets(
+        resource_filter, env_filter, infra_filter, group_filter, name_filter, type_filter
+    )
+    if agno_config is None or ws_to_start is None:
         return
-
-    target_env: Optional[str] = None
-    target_infra: Optional[str] = None
-    target_group: Optional[str] = None
-    target_name: Optional[str] = None
-    target_type: Optional[str] = None
-
-    # derive env:infra:name:type:group from ws_filter
-    if resource_filter is not None:
-        if not isinstance(resource_filter, str):
-            raise TypeError(f"Invalid resource_filter. Expected: str, Received: {type(resource_filter)}")
-        (
-            target_env,
-            target_infra,
-            target_group,
-            target_name,
-            target_type,
-        ) = parse_resource_filter(resource_filter)
-
-    # derive env:infra:name:type:group from command options
-    if target_env is None and env_filter is not None and isinstance(env_filter, str):
-        target_env = env_filter
-    if target_infra is None and infra_filter is not None and isinstance(infra_filter, str):
-        target_infra = infra_filter
-    if target_group is None and group_filter is not None and isinstance(group_filter, str):
-        target_group = group_filter
-    if target_name is None and name_filter is not None and isinstance(name_filter, str):
-        target_name = name_filter
-    if target_type is None and type_filter is not None and isinstance(type_filter, str):
-        target_type = type_filter
-
-    # derive env:infra:name:type:group from defaults
-    if target_env is None:
-        target_env = ws_to_start.workspace_settings.default_env if ws_to_start.workspace_settings else None
-    if target_infra is None:
-        target_infra = ws_to_start.workspace_settings.default_infra if ws_to_start.workspace_settings else None
+    target_env, target_infra, target_group, target_name, target_type = targets
 
     start_workspace(
         agno_config=agno_config,
@@ -288,49 +336,16 @@ def up(
 
 @ws_cli.command(short_help="Delete resources for active workspace")
 def down(
-    resource_filter: Optional[str] = typer.Argument(
-        None,
-        help="Resource filter. Format - ENV:INFRA:GROUP:NAME:TYPE",
-    ),
-    env_filter: str = typer.Option(None, "-e", "--env", metavar="", help="Filter the environment to shut down."),
-    infra_filter: Optional[str] = typer.Option(
-        None, "-i", "--infra", metavar="", help="Filter the infra to shut down."
-    ),
-    group_filter: Optional[str] = typer.Option(
-        None, "-g", "--group", metavar="", help="Filter resources using group name."
-    ),
-    name_filter: Optional[str] = typer.Option(None, "-n", "--name", metavar="", help="Filter resource using name."),
-    type_filter: Optional[str] = typer.Option(
-        None,
-        "-t",
-        "--type",
-        metavar="",
-        help="Filter resource using type",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "-dr",
-        "--dry-run",
-        help="Print resources and exit.",
-    ),
-    auto_confirm: bool = typer.Option(
-        False,
-        "-y",
-        "--yes",
-        help="Skip the confirmation before deleting resources.",
-    ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
-    force: bool = typer.Option(
-        None,
-        "-f",
-        "--force",
-        help="Force",
-    ),
+    resource_filter: ResourceFilterArgument = None,
+    env_filter: EnvFilterOption = None,
+    infra_filter: InfraFilterOption = None,
+    group_filter: GroupFilterOption = None,
+    name_filter: NameFilterOption = None,
+    type_filter: TypeFilterOption = None,
+    dry_run: DryRunOption = False,
+    auto_confirm: AutoConfirmOption = False,
+    print_debug_log: PrintDebugLogOption = False,
+    force: ForceOption = None,
 ):
     """\b
     Delete resources for the active workspace.
@@ -349,93 +364,15 @@ def down(
     if print_debug_log:
         set_log_level_to_debug()
 
-    from agno.cli.config import AgnoCliConfig
-    from agno.cli.operator import initialize_agno
-    from agno.utils.resource_filter import parse_resource_filter
-    from agno.workspace.config import WorkspaceConfig
-    from agno.workspace.helpers import get_workspace_dir_path
-    from agno.workspace.operator import setup_workspace, stop_workspace
-
-    agno_config: Optional[AgnoCliConfig] = AgnoCliConfig.from_saved_config()
-    if not agno_config:
-        agno_config = initialize_agno()
-        if not agno_config:
-            log_config_not_available_msg()
-            return
+    from agno.workspace.operator import stop_workspace
 
     # Workspace to stop
-    ws_to_stop: Optional[WorkspaceConfig] = None
-
-    # If there is an existing workspace at current path, use that workspace
-    current_path: Path = Path(".").resolve()
-    ws_at_current_path: Optional[WorkspaceConfig] = agno_config.get_ws_config_by_path(current_path)
-    if ws_at_current_path is not None:
-        logger.debug(f"Found workspace at: {ws_at_current_path.ws_root_path}")
-        if str(ws_at_current_path.ws_root_path) != agno_config.active_ws_dir:
-            logger.debug(f"Updating active workspace to {ws_at_current_path.ws_root_path}")
-            agno_config.set_active_ws_dir(ws_at_current_path.ws_root_path)
-        ws_to_stop = ws_at_current_path
-
-    # If there's no existing workspace at current path, check if there's a `workspace` dir in the current path
-    # In that case setup the workspace
-    if ws_to_stop is None:
-        workspace_ws_dir_path = get_workspace_dir_path(current_path)
-        if workspace_ws_dir_path is not None:
-            logger.debug(f"Found workspace directory: {workspace_ws_dir_path}")
-            logger.debug(f"Setting up a workspace at: {current_path}")
-            ws_to_stop = setup_workspace(ws_root_path=current_path)
-            print_info("")
-
-    # If there's no workspace at current path, check if an active workspace exists
-    if ws_to_stop is None:
-        active_ws_config: Optional[WorkspaceConfig] = agno_config.get_active_ws_config()
-        # If there's an active workspace, use that workspace
-        if active_ws_config is not None:
-            ws_to_stop = active_ws_config
-
-    # If there's no workspace to stop, raise an error showing available workspaces
-    if ws_to_stop is None:
-        log_active_workspace_not_available()
-        avl_ws = agno_config.available_ws
-        if avl_ws:
-            print_available_workspaces(avl_ws)
+    agno_config, ws_to_stop, targets = _resolve_ws_and_targets(
+        resource_filter, env_filter, infra_filter, group_filter, name_filter, type_filter
+    )
+    if agno_config is None or ws_to_stop is None:
         return
-
-    target_env: Optional[str] = None
-    target_infra: Optional[str] = None
-    target_group: Optional[str] = None
-    target_name: Optional[str] = None
-    target_type: Optional[str] = None
-
-    # derive env:infra:name:type:group from ws_filter
-    if resource_filter is not None:
-        if not isinstance(resource_filter, str):
-            raise TypeError(f"Invalid resource_filter. Expected: str, Received: {type(resource_filter)}")
-        (
-            target_env,
-            target_infra,
-            target_group,
-            target_name,
-            target_type,
-        ) = parse_resource_filter(resource_filter)
-
-    # derive env:infra:name:type:group from command options
-    if target_env is None and env_filter is not None and isinstance(env_filter, str):
-        target_env = env_filter
-    if target_infra is None and infra_filter is not None and isinstance(infra_filter, str):
-        target_infra = infra_filter
-    if target_group is None and group_filter is not None and isinstance(group_filter, str):
-        target_group = group_filter
-    if target_name is None and name_filter is not None and isinstance(name_filter, str):
-        target_name = name_filter
-    if target_type is None and type_filter is not None and isinstance(type_filter, str):
-        target_type = type_filter
-
-    # derive env:infra:name:type:group from defaults
-    if target_env is None:
-        target_env = ws_to_stop.workspace_settings.default_env if ws_to_stop.workspace_settings else None
-    if target_infra is None:
-        target_infra = ws_to_stop.workspace_settings.default_infra if ws_to_stop.workspace_settings else None
+    target_env, target_infra, target_group, target_name, target_type = targets
 
     stop_workspace(
         agno_config=agno_config,
@@ -453,53 +390,17 @@ def down(
 
 @ws_cli.command(short_help="Update resources for active workspace")
 def patch(
-    resource_filter: Optional[str] = typer.Argument(
-        None,
-        help="Resource filter. Format - ENV:INFRA:GROUP:NAME:TYPE",
-    ),
-    env_filter: str = typer.Option(None, "-e", "--env", metavar="", help="Filter the environment to patch."),
-    infra_filter: Optional[str] = typer.Option(None, "-i", "--infra", metavar="", help="Filter the infra to patch."),
-    group_filter: Optional[str] = typer.Option(
-        None, "-g", "--group", metavar="", help="Filter resources using group name."
-    ),
-    name_filter: Optional[str] = typer.Option(None, "-n", "--name", metavar="", help="Filter resource using name."),
-    type_filter: Optional[str] = typer.Option(
-        None,
-        "-t",
-        "--type",
-        metavar="",
-        help="Filter resource using type",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "-dr",
-        "--dry-run",
-        help="Print resources and exit.",
-    ),
-    auto_confirm: bool = typer.Option(
-        False,
-        "-y",
-        "--yes",
-        help="Skip the confirmation before patching resources.",
-    ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
-    force: bool = typer.Option(
-        None,
-        "-f",
-        "--force",
-        help="Force",
-    ),
-    pull: Optional[bool] = typer.Option(
-        None,
-        "-p",
-        "--pull",
-        help="Pull images where applicable.",
-    ),
+    resource_filter: ResourceFilterArgument = None,
+    env_filter: EnvFilterOption = None,
+    infra_filter: InfraFilterOption = None,
+    group_filter: GroupFilterOption = None,
+    name_filter: NameFilterOption = None,
+    type_filter: TypeFilterOption = None,
+    dry_run: DryRunOption = False,
+    auto_confirm: AutoConfirmOption = False,
+    print_debug_log: PrintDebugLogOption = False,
+    force: ForceOption = None,
+    pull: PullOption = None,
 ):
     """\b
     Update resources for the active workspace.
@@ -518,93 +419,15 @@ def patch(
     if print_debug_log:
         set_log_level_to_debug()
 
-    from agno.cli.config import AgnoCliConfig
-    from agno.cli.operator import initialize_agno
-    from agno.utils.resource_filter import parse_resource_filter
-    from agno.workspace.config import WorkspaceConfig
-    from agno.workspace.helpers import get_workspace_dir_path
-    from agno.workspace.operator import setup_workspace, update_workspace
-
-    agno_config: Optional[AgnoCliConfig] = AgnoCliConfig.from_saved_config()
-    if not agno_config:
-        agno_config = initialize_agno()
-        if not agno_config:
-            log_config_not_available_msg()
-            return
+    from agno.workspace.operator import update_workspace
 
     # Workspace to patch
-    ws_to_patch: Optional[WorkspaceConfig] = None
-
-    # If there is an existing workspace at current path, use that workspace
-    current_path: Path = Path(".").resolve()
-    ws_at_current_path: Optional[WorkspaceConfig] = agno_config.get_ws_config_by_path(current_path)
-    if ws_at_current_path is not None:
-        logger.debug(f"Found workspace at: {ws_at_current_path.ws_root_path}")
-        if str(ws_at_current_path.ws_root_path) != agno_config.active_ws_dir:
-            logger.debug(f"Updating active workspace to {ws_at_current_path.ws_root_path}")
-            agno_config.set_active_ws_dir(ws_at_current_path.ws_root_path)
-        ws_to_patch = ws_at_current_path
-
-    # If there's no existing workspace at current path, check if there's a `workspace` dir in the current path
-    # In that case setup the workspace
-    if ws_to_patch is None:
-        workspace_ws_dir_path = get_workspace_dir_path(current_path)
-        if workspace_ws_dir_path is not None:
-            logger.debug(f"Found workspace directory: {workspace_ws_dir_path}")
-            logger.debug(f"Setting up a workspace at: {current_path}")
-            ws_to_patch = setup_workspace(ws_root_path=current_path)
-            print_info("")
-
-    # If there's no workspace at current path, check if an active workspace exists
-    if ws_to_patch is None:
-        active_ws_config: Optional[WorkspaceConfig] = agno_config.get_active_ws_config()
-        # If there's an active workspace, use that workspace
-        if active_ws_config is not None:
-            ws_to_patch = active_ws_config
-
-    # If there's no workspace to patch, raise an error showing available workspaces
-    if ws_to_patch is None:
-        log_active_workspace_not_available()
-        avl_ws = agno_config.available_ws
-        if avl_ws:
-            print_available_workspaces(avl_ws)
+    agno_config, ws_to_patch, targets = _resolve_ws_and_targets(
+        resource_filter, env_filter, infra_filter, group_filter, name_filter, type_filter
+    )
+    if agno_config is None or ws_to_patch is None:
         return
-
-    target_env: Optional[str] = None
-    target_infra: Optional[str] = None
-    target_group: Optional[str] = None
-    target_name: Optional[str] = None
-    target_type: Optional[str] = None
-
-    # derive env:infra:name:type:group from ws_filter
-    if resource_filter is not None:
-        if not isinstance(resource_filter, str):
-            raise TypeError(f"Invalid resource_filter. Expected: str, Received: {type(resource_filter)}")
-        (
-            target_env,
-            target_infra,
-            target_group,
-            target_name,
-            target_type,
-        ) = parse_resource_filter(resource_filter)
-
-    # derive env:infra:name:type:group from command options
-    if target_env is None and env_filter is not None and isinstance(env_filter, str):
-        target_env = env_filter
-    if target_infra is None and infra_filter is not None and isinstance(infra_filter, str):
-        target_infra = infra_filter
-    if target_group is None and group_filter is not None and isinstance(group_filter, str):
-        target_group = group_filter
-    if target_name is None and name_filter is not None and isinstance(name_filter, str):
-        target_name = name_filter
-    if target_type is None and type_filter is not None and isinstance(type_filter, str):
-        target_type = type_filter
-
-    # derive env:infra:name:type:group from defaults
-    if target_env is None:
-        target_env = ws_to_patch.workspace_settings.default_env if ws_to_patch.workspace_settings else None
-    if target_infra is None:
-        target_infra = ws_to_patch.workspace_settings.default_infra if ws_to_patch.workspace_settings else None
+    target_env, target_infra, target_group, target_name, target_type = targets
 
     update_workspace(
         agno_config=agno_config,
@@ -623,53 +446,17 @@ def patch(
 
 @ws_cli.command(short_help="Restart resources for active workspace")
 def restart(
-    resource_filter: Optional[str] = typer.Argument(
-        None,
-        help="Resource filter. Format - ENV:INFRA:GROUP:NAME:TYPE",
-    ),
-    env_filter: str = typer.Option(None, "-e", "--env", metavar="", help="Filter the environment to restart."),
-    infra_filter: Optional[str] = typer.Option(None, "-i", "--infra", metavar="", help="Filter the infra to restart."),
-    group_filter: Optional[str] = typer.Option(
-        None, "-g", "--group", metavar="", help="Filter resources using group name."
-    ),
-    name_filter: Optional[str] = typer.Option(None, "-n", "--name", metavar="", help="Filter resource using name."),
-    type_filter: Optional[str] = typer.Option(
-        None,
-        "-t",
-        "--type",
-        metavar="",
-        help="Filter resource using type",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "-dr",
-        "--dry-run",
-        help="Print resources and exit.",
-    ),
-    auto_confirm: bool = typer.Option(
-        False,
-        "-y",
-        "--yes",
-        help="Skip the confirmation before restarting resources.",
-    ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
-    force: bool = typer.Option(
-        None,
-        "-f",
-        "--force",
-        help="Force",
-    ),
-    pull: Optional[bool] = typer.Option(
-        None,
-        "-p",
-        "--pull",
-        help="Pull images where applicable.",
-    ),
+    resource_filter: ResourceFilterArgument = None,
+    env_filter: EnvFilterOption = None,
+    infra_filter: InfraFilterOption = None,
+    group_filter: GroupFilterOption = None,
+    name_filter: NameFilterOption = None,
+    type_filter: TypeFilterOption = None,
+    dry_run: DryRunOption = False,
+    auto_confirm: AutoConfirmOption = False,
+    print_debug_log: PrintDebugLogOption = False,
+    force: ForceOption = None,
+    pull: PullOption = None,
 ):
     """\b
     Restarts the active workspace. i.e. runs `ag ws down` and then `ag ws up`.
@@ -681,32 +468,38 @@ def restart(
     if print_debug_log:
         set_log_level_to_debug()
 
-    from time import sleep
+    from agno.workspace.operator import start_workspace, stop_workspace
 
-    down(
-        resource_filter=resource_filter,
-        env_filter=env_filter,
-        group_filter=group_filter,
-        infra_filter=infra_filter,
-        name_filter=name_filter,
-        type_filter=type_filter,
+    # Resolve the workspace and targets once and share them across both actions
+    agno_config, ws_to_restart, targets = _resolve_ws_and_targets(
+        resource_filter, env_filter, infra_filter, group_filter, name_filter, type_filter
+    )
+    if agno_config is None or ws_to_restart is None:
+        return
+    target_env, target_infra, target_group, target_name, target_type = targets
+
+    stop_workspace(
+        agno_config=agno_config,
+        ws_config=ws_to_restart,
+        target_env=target_env,
+        target_infra=target_infra,
+        target_group=target_group,
+        target_name=target_name,
+        target_type=target_type,
         dry_run=dry_run,
         auto_confirm=auto_confirm,
-        print_debug_log=print_debug_log,
         force=force,
     )
-    print_info("Sleeping for 2 seconds..")
-    sleep(2)
-    up(
-        resource_filter=resource_filter,
-        env_filter=env_filter,
-        infra_filter=infra_filter,
-        group_filter=group_filter,
-        name_filter=name_filter,
-        type_filter=type_filter,
+    start_workspace(
+        agno_config=agno_config,
+        ws_config=ws_to_restart,
+        target_env=target_env,
+        target_infra=target_infra,
+        target_group=target_group,
+        target_name=target_name,
+        target_type=target_type,
         dry_run=dry_run,
         auto_confirm=auto_confirm,
-        print_debug_log=print_debug_log,
         force=force,
         pull=pull,
     )
@@ -714,12 +507,7 @@ def restart(
 
 @ws_cli.command(short_help="Prints active workspace config")
 def config(
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
+    print_debug_log: PrintDebugLogOption = False,
 ):
     """\b
     Prints the active workspace config
@@ -731,6 +519,8 @@ def config(
     if print_debug_log:
         set_log_level_to_debug()
 
+    import json
+
     from agno.cli.config import AgnoCliConfig
     from agno.cli.operator import initialize_agno
     from agno.utils.load_env import load_env
@@ -746,16 +536,24 @@ def config(
     active_ws_config: Optional[WorkspaceConfig] = agno_config.get_active_ws_config()
     if active_ws_config is None:
         log_active_workspace_not_available()
-        avl_ws = agno_config.available_ws
-        if avl_ws:
-            print_available_workspaces(avl_ws)
+        if agno_config.ws_config_map:
+            print_available_workspaces(agno_config.available_ws)
         return
 
     # Load environment from .env
     load_env(
         dotenv_dir=active_ws_config.ws_root_path,
     )
-    print_info(active_ws_config.model_dump_json(include={"ws_name", "ws_root_path"}, indent=2))
+    # Build the two fields directly instead of going through pydantic's model_dump machinery
+    print_info(
+        json.dumps(
+            {
+                "ws_name": active_ws_config.ws_root_path.stem,
+                "ws_root_path": str(active_ws_config.ws_root_path),
+            },
+            indent=2,
+        )
+    )
 
 
 @ws_cli.command(short_help="Delete workspace record")
@@ -767,12 +565,7 @@ def delete(
         "--all",
         help="Delete all workspaces from Agno",
     ),
-    print_debug_log: bool = typer.Option(
-        False,
-        "-d",
-        "--debug",
-        help="Print debug logs.",
-    ),
+    print_debug_log: PrintDebugLogOption = False,
 ):
     """\b
     Deletes the workspace record from agno.
@@ -797,21 +590,22 @@ def delete(
             log_config_not_available_msg()
             return
 
-    ws_to_delete: List[Path] = []
+    ws_to_delete: Iterable[Path] = ()
     # Delete workspace by name if provided
     if ws_name is not None:
         ws_config = agno_config.get_ws_config_by_dir_name(ws_name)
         if ws_config is None:
             logger.error(f"Workspace {ws_name} not found")
             return
-        ws_to_delete.append(ws_config.ws_root_path)
+        ws_to_delete = (ws_config.ws_root_path,)
     else:
         # Delete all workspaces if flag is set
         if all_workspaces:
-            ws_to_delete = [ws.ws_root_path for ws in agno_config.available_ws if ws.ws_root_path is not None]
+            # delete_workspace iterates this once, so stream instead of building a list
+            ws_to_delete = (ws.ws_root_path for ws in agno_config.available_ws if ws.ws_root_path is not None)
         else:
             # By default, we assume this command is run for the active workspace
             if agno_config.active_ws_dir is not None:
-                ws_to_delete.append(Path(agno_config.active_ws_dir))
+                ws_to_delete = (Path(agno_config.active_ws_dir),)
 
     delete_workspace(agno_config, ws_to_delete)
@@ -0,0 +1,24 @@
+# Lazy re-exports for the infra package.
+# Each submodule pulls its own transitive dependencies, so resolve attributes
+# on first access (PEP 562) instead of importing all of them eagerly.
+_LAZY_IMPORTS = {
+    "InfraApp": "agno.infra.app",
+    "InfraBase": "agno.infra.base",
+    "ContainerContext": "agno.infra.context",
+    "DbApp": "agno.infra.db_app",
+    "InfraResource": "agno.infra.resource",
+    "InfraResources": "agno.infra.resources",
+}
+
+__all__ = list(_LAZY_IMPORTS.keys())
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is not None:
+        from importlib import import_module
+
+        value = getattr(import_module(module_name), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,9 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+from agno.utils.yaml_io import read_yaml_file
 from agno.workspace.settings import WorkspaceSettings
 
 
@@ -69,9 +70,9 @@ class InfraBase(BaseModel):
     workspace_settings: Optional[WorkspaceSettings] = None
 
     # Cached Data
-    cached_workspace_dir: Optional[Path] = None
-    cached_env_file_data: Optional[Dict[str, Any]] = None
-    cached_secret_file_data: Optional[Dict[str, Any]] = None
+    _cached_workspace_dir: Optional[Path] = PrivateAttr(default=None)
+    # Cache of yaml file data keyed by file path, so None is a valid cached value
+    _file_cache: Dict[Optional[Path], Optional[Dict[str, Any]]] = PrivateAttr(default_factory=dict)
 
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
 
@@ -88,15 +89,15 @@ class InfraBase(BaseModel):
 
     @property
     def workspace_dir(self) -> Optional[Path]:
-        if self.cached_workspace_dir is not None:
-            return self.cached_workspace_dir
+        if self._cached_workspace_dir is not None:
+            return self._cached_workspace_dir
 
         if self.workspace_root is not None:
             from agno.workspace.helpers import get_workspace_dir_path
 
             workspace_dir = get_workspace_dir_path(self.workspace_root)
             if workspace_dir is not None:
-                self.cached_workspace_dir = workspace_dir
+                self._cached_workspace_dir = workspace_dir
                 return workspace_dir
         return None
 
@@ -104,19 +105,16 @@ class InfraBase(BaseModel):
         if workspace_settings is not None:
             self.workspace_settings = workspace_settings
 
-    def get_env_file_data(self) -> Optional[Dict[str, Any]]:
-        if self.cached_env_file_data is None:
-            from agno.utils.yaml_io import read_yaml_file
+    def _read_yaml_file_cached(self, file_path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        if file_path not in self._file_cache:
+            self._file_cache[file_path] = read_yaml_file(file_path=file_path)
+        return self._file_cache[file_path]
 
-            self.cached_env_file_data = read_yaml_file(file_path=self.env_file)
-        return self.cached_env_file_data
+    def get_env_file_data(self) -> Optional[Dict[str, Any]]:
+        return self._read_yaml_file_cached(self.env_file)
 
     def get_secret_file_data(self) -> Optional[Dict[str, Any]]:
-        if self.cached_secret_file_data is None:
-            from agno.utils.yaml_io import read_yaml_file
-
-            self.cached_secret_file_data = read_yaml_file(file_path=self.secrets_file)
-        return self.cached_secret_file_data
+        return self._read_yaml_file_cached(self.secrets_file)
 
     def get_secret_from_file(self, secret_name: str) -> Optional[str]:
         secret_file_data = self.get_secret_file_data()
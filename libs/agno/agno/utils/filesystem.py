@@ -1,4 +1,18 @@
+import os
 from pathlib import Path
+from typing import Optional
+
+
+def stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Returns the stat result for path, or None if it does not exist.
+
+    Lets callers answer exists/is_file/is_dir with a single stat syscall
+    instead of one per pathlib method.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 def rmdir_recursive(dir_path: Path) -> bool:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -5,14 +6,29 @@ from agno.utils.log import log_debug, logger
 
 
 def read_pyproject_agno(pyproject_file: Path) -> Optional[Dict]:
-    log_debug(f"Reading {pyproject_file}")
+    try:
+        mtime_ns = pyproject_file.stat().st_mtime_ns
+    except OSError as e:
+        logger.error(f"Could not read {pyproject_file}: {e}")
+        return None
+    return _read_pyproject_agno_cached(str(pyproject_file), mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_pyproject_agno_cached(pyproject_file_str: str, mtime_ns: int) -> Optional[Dict]:
+    """Parses the [tool.agno] table from pyproject_file_str.
+
+    Keyed by (path, mtime_ns) so repeat calls skip the toml parse until
+    the file changes.
+    """
+    log_debug(f"Reading {pyproject_file_str}")
     try:
         import tomli
 
-        pyproject_dict = tomli.loads(pyproject_file.read_text())
+        pyproject_dict = tomli.loads(Path(pyproject_file_str).read_text())
         agno_conf = pyproject_dict.get("tool", {}).get("agno", None)
         if agno_conf is not None and isinstance(agno_conf, dict):
             return agno_conf
     except Exception as e:
-        logger.error(f"Could not read {pyproject_file}: {e}")
+        logger.error(f"Could not read {pyproject_file_str}: {e}")
     return None
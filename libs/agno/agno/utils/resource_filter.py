@@ -1,9 +1,15 @@
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
+@lru_cache(maxsize=128)
 def parse_resource_filter(
     resource_filter: str,
 ) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]]:
+    # Fast-path: a filter without separators is just the env (eg: `ag ws up dev`)
+    if ":" not in resource_filter:
+        return resource_filter or None, None, None, None, None
+
     target_env: Optional[str] = None
     target_infra: Optional[str] = None
     target_group: Optional[str] = None
@@ -8,8 +8,14 @@ def read_yaml_file(file_path: Optional[Path]) -> Optional[Dict[str, Any]]:
     if file_path is not None and file_path.exists() and file_path.is_file():
         import yaml
 
+        # Use the C loader when libyaml is available, it is much faster than the pure-python one
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader  # type: ignore[assignment]
+
         log_debug(f"Reading {file_path}")
-        data_from_file = yaml.safe_load(file_path.read_text())
+        data_from_file = yaml.load(file_path.read_text(), Loader=SafeLoader)
         if data_from_file is not None and isinstance(data_from_file, dict):
             return data_from_file
         else:
@@ -1,5 +1,11 @@
+from concurrent.futures import Future
+from contextlib import contextmanager
+from os import scandir, sep
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from stat import S_ISREG
+from sys import modules as sys_modules
+from sys import path as sys_path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,11 +13,89 @@ from agno.api.schemas.user import TeamSchema
 from agno.api.schemas.workspace import WorkspaceSchema
 from agno.infra.base import InfraBase
 from agno.infra.resources import InfraResources
+from agno.utils.filesystem import stat_or_none
+from agno.utils.load_env import load_env
 from agno.utils.log import logger
+from agno.utils.py_io import get_python_objects_from_module
 from agno.workspace.settings import WorkspaceSettings
 
-# List of directories to ignore when loading the workspace
-ignored_dirs = ["ignore", "test", "tests", "config"]
+# Directories to ignore when loading the workspace
+ignored_dirs = frozenset({"ignore", "test", "tests", "config"})
+
+
+# Cache of loaded resource modules, keyed by the resolved file path.
+# Each entry stores the (st_mtime_ns, st_size) signature of the file when it
+# was loaded, so editing a file invalidates its entry automatically.
+_module_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _load_module_cached(module_path: Path) -> Dict[str, Any]:
+    """Loads python objects from module_path, reusing the cached result if the file is unchanged."""
+    module_stat = stat_or_none(module_path)
+    if module_stat is None:
+        return get_python_objects_from_module(module_path)
+
+    cache_key = str(module_path.resolve())
+    file_signature = (module_stat.st_mtime_ns, module_stat.st_size)
+    cached = _module_cache.get(cache_key)
+    if cached is not None and cached[0] == file_signature:
+        logger.debug(f"Using cached module: {module_path}")
+        return cached[1]
+
+    python_objects = get_python_objects_from_module(module_path)
+    _module_cache[cache_key] = (file_signature, python_objects)
+    return python_objects
+
+
+def clear_module_cache() -> None:
+    """Clears the cache of loaded resource modules."""
+    _module_cache.clear()
+
+
+@contextmanager
+def _temporary_sys_path(path_str: str) -> Iterator[None]:
+    """Temporarily prepends path_str to sys.path.
+
+    Removes it on exit even if the block raises, and drops any sys.modules
+    entries loaded from under path_str so repeat loads pick up file changes.
+    Modules imported from elsewhere (eg agno.docker/agno.aws pulled in by the
+    resource files) are kept so their classes retain identity for later
+    isinstance checks.
+    """
+    modules_before = set(sys_modules)
+    path_prefix = path_str if path_str.endswith(sep) else path_str + sep
+    sys_path.insert(0, path_str)
+    try:
+        yield
+    finally:
+        try:
+            sys_path.remove(path_str)
+        except ValueError:
+            pass
+        for module_name in set(sys_modules) - modules_before:
+            module = sys_modules.get(module_name)
+            module_file = getattr(module, "__file__", None)
+            if module_file is None:
+                spec = getattr(module, "__spec__", None)
+                module_file = spec.origin if spec is not None else None
+            if module_file is not None and module_file.startswith(path_prefix):
+                sys_modules.pop(module_name, None)
+
+
+def _iter_resource_files(root: Path) -> Iterator[Path]:
+    """Yields the python files under root, pruning ignored directories before descent."""
+    stack = [str(root)]
+    while stack:
+        current_dir = stack.pop()
+        with scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in ignored_dirs:
+                        logger.debug(f"Skipping ignored directory: {entry.path}")
+                    else:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                    yield Path(entry.path)
 
 
 class WorkspaceConfig(BaseModel):
@@ -62,7 +146,8 @@ class WorkspaceConfig(BaseModel):
         ws_settings_file: Optional[Path] = None
         if self.workspace_dir_path is not None:
             _ws_settings_file = self.workspace_dir_path.joinpath("settings.py")
-            if _ws_settings_file.exists() and _ws_settings_file.is_file():
+            _ws_settings_file_stat = stat_or_none(_ws_settings_file)
+            if _ws_settings_file_stat is not None and S_ISREG(_ws_settings_file_stat.st_mode):
                 ws_settings_file = _ws_settings_file
         if ws_settings_file is None:
             logger.debug("workspace_settings file not found")
@@ -70,8 +155,6 @@ class WorkspaceConfig(BaseModel):
 
         logger.debug(f"Loading workspace_settings from {ws_settings_file}")
         try:
-            from agno.utils.py_io import get_python_objects_from_module
-
             python_objects = get_python_objects_from_module(ws_settings_file)
             for obj_name, obj in python_objects.items():
                 if isinstance(obj, WorkspaceSettings):
@@ -126,11 +209,6 @@ class WorkspaceConfig(BaseModel):
             logger.warning("WorkspaceConfig.ws_root_path is None")
             return []
 
-        from sys import path as sys_path
-
-        from agno.utils.load_env import load_env
-        from agno.utils.py_io import get_python_objects_from_module
-
         logger.debug("**--> Loading WorkspaceConfig")
         logger.debug(f"Loading .env from {self.ws_root_path}")
         load_env(dotenv_dir=self.ws_root_path)
@@ -140,69 +218,62 @@ class WorkspaceConfig(BaseModel):
         #     eg: https://stackoverflow.com/questions/6323860/sibling-package-imports/50193944#50193944
         # To make them work, we add workspace_root to sys.path so is treated as a module
         logger.debug(f"Adding {self.ws_root_path} to path")
-        sys_path.insert(0, str(self.ws_root_path))
-
-        workspace_dir_path: Optional[Path] = self.workspace_dir_path
-        if workspace_dir_path is not None:
-            logger.debug(f"--^^-- Loading workspace from: {workspace_dir_path}")
-            # Create a dict of objects in the workspace directory
-            workspace_objects: Dict[str, InfraResources] = {}
-            resource_files = workspace_dir_path.rglob("*.py")
-            for resource_file in resource_files:
-                if resource_file.name == "__init__.py":
-                    continue
-
-                resource_file_parts = resource_file.parts
-                workspace_dir_path_parts = workspace_dir_path.parts
-                resource_file_parts_after_ws = resource_file_parts[len(workspace_dir_path_parts) :]
-                # Check if file in ignored directory
-                if any([ignored_dir in resource_file_parts_after_ws for ignored_dir in ignored_dirs]):
-                    logger.debug(f"Skipping file in ignored directory: {resource_file}")
-                    continue
-                logger.debug(f"Reading file: {resource_file}")
-                try:
-                    python_objects = get_python_objects_from_module(resource_file)
-                    # logger.debug(f"python_objects: {python_objects}")
-                    for obj_name, obj in python_objects.items():
-                        if isinstance(obj, WorkspaceSettings):
-                            logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
-                            if self.validate_workspace_settings(obj):
-                                self._workspace_settings = obj
-                                if self.ws_schema is not None and self._workspace_settings is not None:
-                                    self._workspace_settings.ws_schema = self.ws_schema
-                                    logger.debug("Added WorkspaceSchema to WorkspaceSettings")
-                        elif isinstance(obj, InfraResources):
-                            logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
-                            if not obj.enabled:
-                                logger.debug(f"Skipping {obj_name}: disabled")
-                                continue
-                            workspace_objects[obj_name] = obj
-                except Exception:
-                    logger.warning(f"Error in {resource_file}")
-                    raise
-            logger.debug(f"workspace_objects: {workspace_objects}")
-        logger.debug("**--> WorkspaceConfig loaded")
-        logger.debug(f"Removing {self.ws_root_path} from path")
-        sys_path.remove(str(self.ws_root_path))
-
-        # Filter resources by infra
-        filtered_ws_objects_by_infra_type: Dict[str, InfraResources] = {}
         logger.debug(f"Filtering resources for env: {env} | infra: {infra} | order: {order}")
-        if infra is None:
-            filtered_ws_objects_by_infra_type = workspace_objects
-        else:
-            for resource_name, resource in workspace_objects.items():
-                if resource.infra == infra:
-                    filtered_ws_objects_by_infra_type[resource_name] = resource
-
-        # Filter resources by env
-        filtered_infra_objects_by_env: Dict[str, InfraResources] = {}
-        if env is None:
-            filtered_infra_objects_by_env = filtered_ws_objects_by_infra_type
-        else:
-            for resource_name, resource in filtered_ws_objects_by_infra_type.items():
-                if resource.env == env:
-                    filtered_infra_objects_by_env[resource_name] = resource
+        workspace_objects: Dict[str, InfraResources] = {}
+        with _temporary_sys_path(str(self.ws_root_path)):
+            workspace_dir_path: Optional[Path] = self.workspace_dir_path
+            if workspace_dir_path is not None:
+                logger.debug(f"--^^-- Loading workspace from: {workspace_dir_path}")
+                # Collect the resource files to read, skipping ignored directories
+                resource_files: List[Path] = list(_iter_resource_files(workspace_dir_path))
+
+                # Read the resource files. The module imports are independent and
+                # I/O bound, so fan out to a thread pool when there are several.
+                loaded_modules: List[Tuple[Path, Optional["Future[Dict[str, Any]]"]]]
+                if len(resource_files) > 1:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=min(32, len(resource_files))) as executor:
+                        loaded_modules = [
+                            (resource_file, executor.submit(_load_module_cached, resource_file))
+                            for resource_file in resource_files
+                        ]
+                else:
+                    loaded_modules = [(resource_file, None) for resource_file in resource_files]
+
+                # Create a dict of objects in the workspace directory
+                for resource_file, future in loaded_modules:
+                    logger.debug(f"Reading file: {resource_file}")
+                    try:
+                        if future is not None:
+                            python_objects = future.result()
+                        else:
+                            python_objects = _load_module_cached(resource_file)
+                        # logger.debug(f"python_objects: {python_objects}")
+                        for obj_name, obj in python_objects.items():
+                            if isinstance(obj, WorkspaceSettings):
+                                logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
+                                if self.validate_workspace_settings(obj):
+                                    self._workspace_settings = obj
+                                    if self.ws_schema is not None and self._workspace_settings is not None:
+                                        self._workspace_settings.ws_schema = self.ws_schema
+                                        logger.debug("Added WorkspaceSchema to WorkspaceSettings")
+                            elif isinstance(obj, InfraResources):
+                                logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
+                                if not obj.enabled:
+                                    logger.debug(f"Skipping {obj_name}: disabled")
+                                    continue
+                                # Apply the env/infra filters at discovery time so
+                                # non-matching resources are never materialized
+                                if (infra is not None and obj.infra != infra) or (env is not None and obj.env != env):
+                                    logger.debug(f"Skipping {obj_name}: does not match the env/infra filters")
+                                    continue
+                                workspace_objects[obj_name] = obj
+                    except Exception:
+                        logger.warning(f"Error in {resource_file}")
+                        raise
+                logger.debug(f"workspace_objects: {workspace_objects}")
+        logger.debug("**--> WorkspaceConfig loaded")
 
         # Updated resources with the workspace settings
         # Create a temporary workspace settings object if it does not exist
@@ -214,13 +285,13 @@ class WorkspaceConfig(BaseModel):
             logger.debug(f"Created WorkspaceSettings: {self._workspace_settings}")
         # Update the resources with the workspace settings
         if self._workspace_settings is not None:
-            for resource_name, resource in filtered_infra_objects_by_env.items():
+            for resource_name, resource in workspace_objects.items():
                 logger.debug(f"Setting workspace settings for {resource.__class__.__name__}")
                 resource.set_workspace_settings(self._workspace_settings)
 
         # Create a list of InfraResources from the filtered resources
         infra_resources_list: List[InfraResources] = []
-        for resource_name, resource in filtered_infra_objects_by_env.items():
+        for resource_name, resource in workspace_objects.items():
             # If the resource is an InfraResources object, add it to the list
             if isinstance(resource, InfraResources):
                 infra_resources_list.append(resource)
@@ -241,11 +312,6 @@ class WorkspaceConfig(BaseModel):
         if not resource_file.suffix == ".py":
             raise ValueError(f"File {resource_file} is not a python file")
 
-        from sys import path as sys_path
-
-        from agno.utils.load_env import load_env
-        from agno.utils.py_io import get_python_objects_from_module
-
         resource_file_parent_dir = resource_file.parent.resolve()
         logger.debug(f"Loading .env from {resource_file_parent_dir}")
         load_env(dotenv_dir=resource_file_parent_dir)
@@ -257,45 +323,31 @@ class WorkspaceConfig(BaseModel):
         #     eg: https://stackoverflow.com/questions/6323860/sibling-package-imports/50193944#50193944
         # To make them work, we add the resource_file_parent_dir to sys.path so it can be treated as a module
         logger.debug(f"Adding {resource_file_parent_dir} to path")
-        sys_path.insert(0, str(resource_file_parent_dir))
-
         logger.debug(f"**--> Reading Infra resources from {resource_file}")
+        logger.debug(f"Filtering resources for env: {env} | infra: {infra} | order: {order}")
 
         # Get all infra resources from the file
         infra_objects: Dict[str, InfraBase] = {}
-        try:
-            # Get all python objects from the file
-            python_objects = get_python_objects_from_module(resource_file)
-            # Filter out the objects that are subclasses of InfraBase
-            for obj_name, obj in python_objects.items():
-                if isinstance(obj, InfraBase):
-                    logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
-                    if not obj.enabled:
-                        logger.debug(f"Skipping {obj_name}: disabled")
-                        continue
-                    infra_objects[obj_name] = obj
-        except Exception:
-            logger.error(f"Error reading: {resource_file}")
-            raise
-
-        # Filter resources by infra
-        filtered_infra_objects_by_infra_type: Dict[str, InfraBase] = {}
-        logger.debug(f"Filtering resources for env: {env} | infra: {infra} | order: {order}")
-        if infra is None:
-            filtered_infra_objects_by_infra_type = infra_objects
-        else:
-            for resource_name, resource in infra_objects.items():
-                if resource.infra == infra:
-                    filtered_infra_objects_by_infra_type[resource_name] = resource
-
-        # Filter resources by env
-        filtered_infra_objects_by_env: Dict[str, InfraBase] = {}
-        if env is None:
-            filtered_infra_objects_by_env = filtered_infra_objects_by_infra_type
-        else:
-            for resource_name, resource in filtered_infra_objects_by_infra_type.items():
-                if resource.env == env:
-                    filtered_infra_objects_by_env[resource_name] = resource
+        with _temporary_sys_path(str(resource_file_parent_dir)):
+            try:
+                # Get all python objects from the file
+                python_objects = _load_module_cached(resource_file)
+                # Filter out the objects that are subclasses of InfraBase
+                for obj_name, obj in python_objects.items():
+                    if isinstance(obj, InfraBase):
+                        logger.debug(f"Found: {obj.__class__.__module__}: {obj_name}")
+                        if not obj.enabled:
+                            logger.debug(f"Skipping {obj_name}: disabled")
+                            continue
+                        # Apply the env/infra filters at discovery time so
+                        # non-matching resources are never materialized
+                        if (infra is not None and obj.infra != infra) or (env is not None and obj.env != env):
+                            logger.debug(f"Skipping {obj_name}: does not match the env/infra filters")
+                            continue
+                        infra_objects[obj_name] = obj
+            except Exception:
+                logger.error(f"Error reading: {resource_file}")
+                raise
 
         # Updated resources with the workspace settings
         # Create a temporary workspace settings object if it does not exist
@@ -306,13 +358,13 @@ class WorkspaceConfig(BaseModel):
             )
         # Update the resources with the workspace settings
         if temporary_ws_config._workspace_settings is not None:
-            for resource_name, resource in filtered_infra_objects_by_env.items():
+            for resource_name, resource in infra_objects.items():
                 logger.debug(f"Setting workspace settings for {resource.__class__.__name__}")
                 resource.set_workspace_settings(temporary_ws_config._workspace_settings)
 
         # Create a list of InfraResources from the filtered resources
         infra_resources_list: List[InfraResources] = []
-        for resource_name, resource in filtered_infra_objects_by_env.items():
+        for resource_name, resource in infra_objects.items():
             # If the resource is an InfraResources object, add it to the list
             if isinstance(resource, InfraResources):
                 infra_resources_list.append(resource)
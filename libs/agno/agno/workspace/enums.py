@@ -1,6 +1,22 @@
 from enum import Enum
 
+# Repo to clone for each starter template
+_TEMPLATE_TO_REPO = {
+    "agent-app": "https://github.com/agno-agi/agent-app-aws",
+    "agent-api": "https://github.com/agno-agi/agent-api-aws",
+}
+
 
 class WorkspaceStarterTemplate(str, Enum):
     agent_app = "agent-app"
     agent_api = "agent-api"
+
+    @property
+    def folder_name(self) -> str:
+        """Default directory name for a workspace created from this template"""
+        return self.value
+
+    @property
+    def repo_url(self) -> str:
+        """URL of the template repo to clone"""
+        return _TEMPLATE_TO_REPO[self.value]
@@ -1,6 +1,9 @@
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Optional
 
+from agno.utils.filesystem import stat_or_none
 from agno.utils.log import logger
 
 
@@ -22,20 +25,32 @@ def get_workspace_dir_path(ws_root_path: Path) -> Path:
     Agno workspace dir can be found at:
         1. subdirectory: workspace
         2. In a folder defined by the pyproject.toml file
+
+    The result is cached per workspace root for the lifetime of the process,
+    the directory layout does not change between commands.
     """
+    return _get_workspace_dir_path(str(ws_root_path))
+
+
+@lru_cache(maxsize=32)
+def _get_workspace_dir_path(ws_root_str: str) -> Path:
     from agno.utils.pyproject import read_pyproject_agno
 
+    ws_root_path = Path(ws_root_str)
+
     logger.debug(f"Searching for a workspace directory in {ws_root_path}")
 
     # Case 1: Look for a subdirectory with name: workspace
     ws_workspace_dir = ws_root_path.joinpath("workspace")
     logger.debug(f"Searching {ws_workspace_dir}")
-    if ws_workspace_dir.exists() and ws_workspace_dir.is_dir():
+    ws_workspace_dir_stat = stat_or_none(ws_workspace_dir)
+    if ws_workspace_dir_stat is not None and S_ISDIR(ws_workspace_dir_stat.st_mode):
         return ws_workspace_dir
 
     # Case 2: Look for a folder defined by the pyproject.toml file
     ws_pyproject_toml = ws_root_path.joinpath("pyproject.toml")
-    if ws_pyproject_toml.exists() and ws_pyproject_toml.is_file():
+    ws_pyproject_toml_stat = stat_or_none(ws_pyproject_toml)
+    if ws_pyproject_toml_stat is not None and S_ISREG(ws_pyproject_toml_stat.st_mode):
         agno_conf = read_pyproject_agno(ws_pyproject_toml)
         if agno_conf is not None:
             agno_conf_workspace_dir_str = agno_conf.get("workspace", None)
@@ -45,7 +60,8 @@ def get_workspace_dir_path(ws_root_path: Path) -> Path:
                 logger.error("Workspace directory not specified in pyproject.toml")
                 exit(0)
             logger.debug(f"Searching {agno_conf_workspace_dir_path}")
-            if agno_conf_workspace_dir_path.exists() and agno_conf_workspace_dir_path.is_dir():
+            agno_conf_workspace_dir_stat = stat_or_none(agno_conf_workspace_dir_path)
+            if agno_conf_workspace_dir_stat is not None and S_ISDIR(agno_conf_workspace_dir_stat.st_mode):
                 return agno_conf_workspace_dir_path
 
     logger.error(f"Could not find a workspace at: {ws_root_path}")
@@ -1,7 +1,7 @@
+from logging import DEBUG
 from pathlib import Path
-from typing import Dict, List, Optional, cast
-
-from rich.prompt import Prompt
+from stat import S_ISDIR
+from typing import Iterable, List, Optional, cast
 
 from agno.api.schemas.user import TeamIdentifier, TeamSchema
 from agno.api.schemas.workspace import (
@@ -21,18 +21,14 @@ from agno.cli.console import (
 )
 from agno.infra.resources import InfraResources
 from agno.utils.common import str_to_int
+from agno.utils.filesystem import stat_or_none
 from agno.utils.log import logger
 from agno.workspace.config import WorkspaceConfig
 from agno.workspace.enums import WorkspaceStarterTemplate
 
-TEMPLATE_TO_NAME_MAP: Dict[WorkspaceStarterTemplate, str] = {
-    WorkspaceStarterTemplate.agent_app: "agent-app",
-    WorkspaceStarterTemplate.agent_api: "agent-api",
-}
-TEMPLATE_TO_REPO_MAP: Dict[WorkspaceStarterTemplate, str] = {
-    WorkspaceStarterTemplate.agent_app: "https://github.com/agno-agi/agent-app-aws",
-    WorkspaceStarterTemplate.agent_api: "https://github.com/agno-agi/agent-api-aws",
-}
+# The starter templates are fixed at import time
+_ALL_TEMPLATES = tuple(WorkspaceStarterTemplate)
+_TEMPLATE_VALUES = frozenset(t.value for t in WorkspaceStarterTemplate)
 
 
 def create_workspace(
@@ -43,16 +39,9 @@ def create_workspace(
     This function clones a template or url on the users machine at the path:
         cwd/name
     """
-    from shutil import copytree
-
-    import git
-
     from agno.cli.operator import initialize_agno
-    from agno.utils.filesystem import rmdir_recursive
-    from agno.utils.git import GitCloneProgress
-    from agno.workspace.helpers import get_workspace_dir_path
 
-    current_dir: Path = Path(".").resolve()
+    current_dir: Path = Path.cwd()
 
     # Initialize Agno before creating a workspace
     agno_config: Optional[AgnoCliConfig] = AgnoCliConfig.from_saved_config()
@@ -66,19 +55,21 @@ def create_workspace(
     ws_dir_name: Optional[str] = name
     repo_to_clone: Optional[str] = url
     ws_template = WorkspaceStarterTemplate.agent_app
-    templates = list(WorkspaceStarterTemplate.__members__.values())
+    templates = _ALL_TEMPLATES
 
     if repo_to_clone is None:
         # Get repo_to_clone from template
         if template is None:
+            from rich.prompt import Prompt
+
             # Get starter template from the user if template is not provided
             # Display available starter templates and ask user to select one
             print_info("Select starter template or press Enter for default (agent-app)")
             for template_id, template_name in enumerate(templates, start=1):
-                print_info("  [b][{}][/b] {}".format(template_id, WorkspaceStarterTemplate(template_name).value))
+                print_info("  [b][{}][/b] {}".format(template_id, template_name.value))
 
             # Get starter template from the user
-            template_choices = [str(idx) for idx, _ in enumerate(templates, start=1)]
+            template_choices = list(map(str, range(1, len(templates) + 1)))
             template_inp_raw = Prompt.ask("Template Number", choices=template_choices, default="1", show_choices=False)
             # Convert input to int
             template_inp = str_to_int(template_inp_raw)
@@ -86,22 +77,25 @@ def create_workspace(
             if template_inp is not None:
                 template_inp_idx = template_inp - 1
                 ws_template = WorkspaceStarterTemplate(templates[template_inp_idx])
-        elif template.lower() in WorkspaceStarterTemplate.__members__.values():
-            ws_template = WorkspaceStarterTemplate(template)
         else:
-            raise Exception(f"{template} is not a supported template, please choose from: {templates}")
+            template_lower = template.lower()
+            if template_lower not in _TEMPLATE_VALUES:
+                raise Exception(f"{template} is not a supported template, please choose from: {templates}")
+            ws_template = WorkspaceStarterTemplate(template_lower)
 
         logger.debug(f"Selected Template: {ws_template.value}")
-        repo_to_clone = TEMPLATE_TO_REPO_MAP.get(ws_template)
+        repo_to_clone = ws_template.repo_url
 
     if ws_dir_name is None:
+        from rich.prompt import Prompt
+
         default_ws_name = "agent-app"
         if url is not None:
             # Get default_ws_name from url
             default_ws_name = url.split("/")[-1].split(".")[0]
         else:
             # Get default_ws_name from template
-            default_ws_name = TEMPLATE_TO_NAME_MAP.get(ws_template, "agent-app")
+            default_ws_name = ws_template.folder_name
         logger.debug(f"Asking for ws name with default: {default_ws_name}")
         # Ask user for workspace name if not provided
         ws_dir_name = Prompt.ask("Workspace Name", default=default_ws_name, console=console)
@@ -119,42 +113,58 @@ def create_workspace(
         logger.error(f"Directory {ws_root_path} exists, please delete directory or choose another name for workspace")
         return None
 
+    # gitpython is only needed once we actually clone; the command can exit
+    # earlier at the prompts or validation above
+    import git
+
+    from agno.utils.git import GitCloneProgress
+
     print_info(f"Creating {str(ws_root_path)}")
     logger.debug("Cloning: {}".format(repo_to_clone))
     try:
+        # The .git folder is deleted right after cloning, so only the latest
+        # snapshot of the default branch is needed
         _cloned_git_repo: git.Repo = git.Repo.clone_from(
             repo_to_clone,
             str(ws_root_path),
             progress=GitCloneProgress(),  # type: ignore
+            multi_options=["--depth=1", "--single-branch", "--no-tags"],
         )
     except Exception as e:
         logger.error(e)
         return None
 
+    from shutil import copyfile, copytree, rmtree
+
+    from agno.workspace.helpers import get_workspace_dir_path
+
     # Remove existing .git folder
     _dot_git_folder = ws_root_path.joinpath(".git")
-    _dot_git_exists = _dot_git_folder.exists()
-    if _dot_git_exists:
-        logger.debug(f"Deleting {_dot_git_folder}")
-        try:
-            _dot_git_exists = not rmdir_recursive(_dot_git_folder)
-        except Exception as e:
-            logger.warning(f"Failed to delete {_dot_git_folder}: {e}")
-            logger.info("Please delete the .git folder manually")
-            pass
+    logger.debug(f"Deleting {_dot_git_folder}")
+    try:
+        rmtree(_dot_git_folder)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to delete {_dot_git_folder}: {e}")
+        logger.info("Please delete the .git folder manually")
 
     agno_config.add_new_ws_to_config(ws_root_path=ws_root_path)
 
     try:
         # workspace_dir_path is the path to the ws_root/workspace dir
         workspace_dir_path: Path = get_workspace_dir_path(ws_root_path)
-        workspace_secrets_dir = workspace_dir_path.joinpath("secrets").resolve()
-        workspace_example_secrets_dir = workspace_dir_path.joinpath("example_secrets").resolve()
+        # workspace_dir_path is already absolute, no need to resolve
+        workspace_secrets_dir = workspace_dir_path / "secrets"
+        workspace_example_secrets_dir = workspace_dir_path / "example_secrets"
 
         print_info(f"Creating {str(workspace_secrets_dir)}")
+        # copyfile skips the permission/xattr copy that copytree does by default,
+        # the template secrets only need their contents copied
         copytree(
-            str(workspace_example_secrets_dir),
-            str(workspace_secrets_dir),
+            workspace_example_secrets_dir,
+            workspace_secrets_dir,
+            copy_function=copyfile,
         )
     except Exception as e:
         logger.warning(f"Could not create workspace/secrets: {e}")
@@ -193,7 +203,8 @@ def setup_workspace(ws_root_path: Path) -> Optional[WorkspaceConfig]:
     ## 1. Pre-requisites
     ######################################################
     # 1.1 Check ws_root_path exists and is a directory
-    ws_is_valid: bool = ws_root_path is not None and ws_root_path.exists() and ws_root_path.is_dir()
+    ws_root_stat = stat_or_none(ws_root_path) if ws_root_path is not None else None
+    ws_is_valid: bool = ws_root_stat is not None and S_ISDIR(ws_root_stat.st_mode)
     if not ws_is_valid:
         logger.error("Invalid directory: {}".format(ws_root_path))
         return None
@@ -271,6 +282,8 @@ def setup_workspace(ws_root_path: Path) -> Optional[WorkspaceConfig]:
                 teams = get_teams_for_user(agno_config.user)
                 status.stop()
             if teams is not None and len(teams) > 0:
+                from rich.prompt import Prompt
+
                 logger.debug(f"The user has {len(teams)} available teams. Checking if they want to use one of them")
                 print_info("Which account would you like to create this workspace in?")
                 print_info("  [b][1][/b] Personal (default)")
@@ -369,9 +382,16 @@ def setup_workspace(ws_root_path: Path) -> Optional[WorkspaceConfig]:
     ######################################################
 
 
-def start_workspace(
+def _run_workspace_action(
     agno_config: AgnoCliConfig,
     ws_config: WorkspaceConfig,
+    heading: str,
+    action: str,
+    action_gerund: str,
+    action_past: str,
+    order: str,
+    resource_method_name: str,
+    event_type: str,
     target_env: Optional[str] = None,
     target_infra: Optional[str] = None,
     target_group: Optional[str] = None,
@@ -380,75 +400,104 @@ def start_workspace(
     dry_run: Optional[bool] = False,
     auto_confirm: Optional[bool] = False,
     force: Optional[bool] = None,
-    pull: Optional[bool] = False,
+    pull: Optional[bool] = None,
 ) -> None:
-    """Start an Agno Workspace. This is called from `ag ws up`"""
+    """Runs a create/delete/update action over the workspace resource groups.
+
+    Shared implementation behind start_workspace, stop_workspace and update_workspace.
+    """
     if ws_config is None:
         logger.error("WorkspaceConfig invalid")
         return
 
-    print_heading("Starting workspace: {}".format(str(ws_config.ws_root_path.stem)))
-    logger.debug(f"\ttarget_env   : {target_env}")
-    logger.debug(f"\ttarget_infra : {target_infra}")
-    logger.debug(f"\ttarget_group : {target_group}")
-    logger.debug(f"\ttarget_name  : {target_name}")
-    logger.debug(f"\ttarget_type  : {target_type}")
-    logger.debug(f"\tdry_run      : {dry_run}")
-    logger.debug(f"\tauto_confirm : {auto_confirm}")
-    logger.debug(f"\tforce        : {force}")
-    logger.debug(f"\tpull         : {pull}")
+    print_heading("{} workspace: {}".format(heading, str(ws_config.ws_root_path.stem)))
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            f"\ttarget_env   : {target_env}\n"
+            f"\ttarget_infra : {target_infra}\n"
+            f"\ttarget_group : {target_group}\n"
+            f"\ttarget_name  : {target_name}\n"
+            f"\ttarget_type  : {target_type}\n"
+            f"\tdry_run      : {dry_run}\n"
+            f"\tauto_confirm : {auto_confirm}\n"
+            f"\tforce        : {force}\n"
+            f"\tpull         : {pull}"
+        )
 
     # Set the local environment variables before processing configs
     ws_config.set_local_env()
 
-    # Get resource groups to deploy
-    resource_groups_to_create: List[InfraResources] = ws_config.get_resources(
+    # Get resource groups to process
+    resource_groups: List[InfraResources] = ws_config.get_resources(
         env=target_env,
         infra=target_infra,
-        order="create",
+        order=order,
     )
 
-    # Track number of resource groups created
-    num_rgs_created = 0
-    num_rgs_to_create = len(resource_groups_to_create)
-    # Track number of resources created
-    num_resources_created = 0
-    num_resources_to_create = 0
+    # Track number of resource groups processed
+    num_rgs_completed = 0
+    num_rgs_to_complete = len(resource_groups)
+    # Track number of resources processed
+    num_resources_completed = 0
+    num_resources_to_complete = 0
 
-    if num_rgs_to_create == 0:
-        print_info("No resources to create")
+    if num_rgs_to_complete == 0:
+        print_info(f"No resources to {action}")
         return
 
-    logger.debug(f"Deploying {num_rgs_to_create} resource groups")
-    for rg in resource_groups_to_create:
-        _num_resources_created, _num_resources_to_create = rg.create_resources(
-            group_filter=target_group,
-            name_filter=target_name,
-            type_filter=target_type,
-            dry_run=dry_run,
-            auto_confirm=auto_confirm,
-            force=force,
-            pull=pull,
-        )
-        if _num_resources_created > 0:
-            num_rgs_created += 1
-        num_resources_created += _num_resources_created
-        num_resources_to_create += _num_resources_to_create
-        logger.debug(f"Deployed {num_resources_created} resources in {num_rgs_created} resource groups")
+    resource_method_kwargs = {
+        "group_filter": target_group,
+        "name_filter": target_name,
+        "type_filter": target_type,
+        "dry_run": dry_run,
+        "auto_confirm": auto_confirm,
+        "force": force,
+    }
+    # delete_resources does not take a pull argument
+    if resource_method_name != "delete_resources":
+        resource_method_kwargs["pull"] = pull
+
+    logger.debug(f"{action_gerund} {num_rgs_to_complete} resource groups")
+    # Resource groups are independent, so create/update can fan out to a thread
+    # pool when there is no confirmation prompt to interleave. Deletes stay
+    # serial to respect the teardown order.
+    run_in_parallel = resource_method_name != "delete_resources" and bool(auto_confirm) and num_rgs_to_complete > 1
+    if run_in_parallel:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, num_rgs_to_complete)) as executor:
+            results = list(
+                executor.map(lambda rg: getattr(rg, resource_method_name)(**resource_method_kwargs), resource_groups)
+            )
+    else:
+        results = [getattr(rg, resource_method_name)(**resource_method_kwargs) for rg in resource_groups]
+
+    for _num_resources_completed, _num_resources_to_complete in results:
+        if _num_resources_completed > 0:
+            num_rgs_completed += 1
+        num_resources_completed += _num_resources_completed
+        num_resources_to_complete += _num_resources_to_complete
+    logger.debug(
+        f"{action_past.capitalize()} {num_resources_completed} resources in {num_rgs_completed} resource groups"
+    )
 
     if dry_run:
         return
 
-    if num_resources_created == 0:
+    # Nothing inside the groups matched the group/name/type filters
+    if num_resources_to_complete == 0:
         return
 
-    print_heading(f"\n--**-- ResourceGroups deployed: {num_rgs_created}/{num_rgs_to_create}\n")
+    print_heading(f"\n--**-- ResourceGroups {action_past}: {num_rgs_completed}/{num_rgs_to_complete}\n")
 
-    workspace_event_status = "in_progress"
-    if num_resources_created == num_resources_to_create:
-        workspace_event_status = "success"
-    else:
-        logger.error("Some resources failed to create, please check logs")
+    workspace_event_status = "success"
+    if num_resources_completed != num_resources_to_complete:
+        # This also covers the case where every resource failed; an early
+        # return on num_resources_completed == 0 used to mask it
+        logger.error(
+            f"Some resources failed to {action} "
+            f"({num_resources_completed}/{num_resources_to_complete}), please check logs"
+        )
         workspace_event_status = "failed"
 
     if (
@@ -456,12 +505,12 @@ def start_workspace(
         and ws_config.ws_schema is not None
         and ws_config.ws_schema.id_workspace is not None
     ):
-        # Log workspace start event
+        # Log the workspace event
         log_workspace_event(
             user=agno_config.user,
             workspace_event=WorkspaceEvent(
                 id_workspace=ws_config.ws_schema.id_workspace,
-                event_type="start",
+                event_type=event_type,
                 event_status=workspace_event_status,
                 event_data={
                     "target_env": target_env,
@@ -477,7 +526,7 @@ def start_workspace(
         )
 
 
-def stop_workspace(
+def start_workspace(
     agno_config: AgnoCliConfig,
     ws_config: WorkspaceConfig,
     target_env: Optional[str] = None,
@@ -488,99 +537,64 @@ def stop_workspace(
     dry_run: Optional[bool] = False,
     auto_confirm: Optional[bool] = False,
     force: Optional[bool] = None,
+    pull: Optional[bool] = False,
 ) -> None:
-    """Stop an Agno Workspace. This is called from `ag ws down`"""
-    if ws_config is None:
-        logger.error("WorkspaceConfig invalid")
-        return
-
-    print_heading("Stopping workspace: {}".format(str(ws_config.ws_root_path.stem)))
-    logger.debug(f"\ttarget_env   : {target_env}")
-    logger.debug(f"\ttarget_infra : {target_infra}")
-    logger.debug(f"\ttarget_group : {target_group}")
-    logger.debug(f"\ttarget_name  : {target_name}")
-    logger.debug(f"\ttarget_type  : {target_type}")
-    logger.debug(f"\tdry_run      : {dry_run}")
-    logger.debug(f"\tauto_confirm : {auto_confirm}")
-    logger.debug(f"\tforce        : {force}")
+    """Start an Agno Workspace. This is called from `ag ws up`"""
+    _run_workspace_action(
+        agno_config=agno_config,
+        ws_config=ws_config,
+        heading="Starting",
+        action="create",
+        action_gerund="Deploying",
+        action_past="deployed",
+        order="create",
+        resource_method_name="create_resources",
+        event_type="start",
+        target_env=target_env,
+        target_infra=target_infra,
+        target_group=target_group,
+        target_name=target_name,
+        target_type=target_type,
+        dry_run=dry_run,
+        auto_confirm=auto_confirm,
+        force=force,
+        pull=pull,
+    )
 
-    # Set the local environment variables before processing configs
-    ws_config.set_local_env()
 
-    # Get resource groups to delete
-    resource_groups_to_delete: List[InfraResources] = ws_config.get_resources(
-        env=target_env,
-        infra=target_infra,
+def stop_workspace(
+    agno_config: AgnoCliConfig,
+    ws_config: WorkspaceConfig,
+    target_env: Optional[str] = None,
+    target_infra: Optional[str] = None,
+    target_group: Optional[str] = None,
+    target_name: Optional[str] = None,
+    target_type: Optional[str] = None,
+    dry_run: Optional[bool] = False,
+    auto_confirm: Optional[bool] = False,
+    force: Optional[bool] = None,
+) -> None:
+    """Stop an Agno Workspace. This is called from `ag ws down`"""
+    _run_workspace_action(
+        agno_config=agno_config,
+        ws_config=ws_config,
+        heading="Stopping",
+        action="delete",
+        action_gerund="Deleting",
+        action_past="deleted",
         order="delete",
+        resource_method_name="delete_resources",
+        event_type="stop",
+        target_env=target_env,
+        target_infra=target_infra,
+        target_group=target_group,
+        target_name=target_name,
+        target_type=target_type,
+        dry_run=dry_run,
+        auto_confirm=auto_confirm,
+        force=force,
     )
 
-    # Track number of resource groups deleted
-    num_rgs_deleted = 0
-    num_rgs_to_delete = len(resource_groups_to_delete)
-    # Track number of resources deleted
-    num_resources_deleted = 0
-    num_resources_to_delete = 0
-
-    if num_rgs_to_delete == 0:
-        print_info("No resources to delete")
-        return
-
-    logger.debug(f"Deleting {num_rgs_to_delete} resource groups")
-    for rg in resource_groups_to_delete:
-        _num_resources_deleted, _num_resources_to_delete = rg.delete_resources(
-            group_filter=target_group,
-            name_filter=target_name,
-            type_filter=target_type,
-            dry_run=dry_run,
-            auto_confirm=auto_confirm,
-            force=force,
-        )
-        if _num_resources_deleted > 0:
-            num_rgs_deleted += 1
-        num_resources_deleted += _num_resources_deleted
-        num_resources_to_delete += _num_resources_to_delete
-        logger.debug(f"Deleted {num_resources_deleted} resources in {num_rgs_deleted} resource groups")
-
-    if dry_run:
-        return
-
-    if num_resources_deleted == 0:
-        return
-
-    print_heading(f"\n--**-- ResourceGroups deleted: {num_rgs_deleted}/{num_rgs_to_delete}\n")
-
-    workspace_event_status = "in_progress"
-    if num_resources_to_delete == num_resources_deleted:
-        workspace_event_status = "success"
-    else:
-        logger.error("Some resources failed to delete, please check logs")
-        workspace_event_status = "failed"
-
-    if (
-        agno_config.user is not None
-        and ws_config.ws_schema is not None
-        and ws_config.ws_schema.id_workspace is not None
-    ):
-        # Log workspace stop event
-        log_workspace_event(
-            user=agno_config.user,
-            workspace_event=WorkspaceEvent(
-                id_workspace=ws_config.ws_schema.id_workspace,
-                event_type="stop",
-                event_status=workspace_event_status,
-                event_data={
-                    "target_env": target_env,
-                    "target_infra": target_infra,
-                    "target_group": target_group,
-                    "target_name": target_name,
-                    "target_type": target_type,
-                    "dry_run": dry_run,
-                    "auto_confirm": auto_confirm,
-                    "force": force,
-                },
-            ),
-        )
-
 
 def update_workspace(
     agno_config: AgnoCliConfig,
@@ -596,106 +610,37 @@ def update_workspace(
     pull: Optional[bool] = False,
 ) -> None:
     """Update an Agno Workspace. This is called from `ag ws patch`"""
-    if ws_config is None:
-        logger.error("WorkspaceConfig invalid")
-        return
-
-    print_heading("Updating workspace: {}".format(str(ws_config.ws_root_path.stem)))
-    logger.debug(f"\ttarget_env   : {target_env}")
-    logger.debug(f"\ttarget_infra : {target_infra}")
-    logger.debug(f"\ttarget_group : {target_group}")
-    logger.debug(f"\ttarget_name  : {target_name}")
-    logger.debug(f"\ttarget_type  : {target_type}")
-    logger.debug(f"\tdry_run      : {dry_run}")
-    logger.debug(f"\tauto_confirm : {auto_confirm}")
-    logger.debug(f"\tforce        : {force}")
-    logger.debug(f"\tpull         : {pull}")
-
-    # Set the local environment variables before processing configs
-    ws_config.set_local_env()
-
-    # Get resource groups to update
-    resource_groups_to_update: List[InfraResources] = ws_config.get_resources(
-        env=target_env,
-        infra=target_infra,
+    _run_workspace_action(
+        agno_config=agno_config,
+        ws_config=ws_config,
+        heading="Updating",
+        action="update",
+        action_gerund="Updating",
+        action_past="updated",
         order="create",
+        resource_method_name="update_resources",
+        event_type="update",
+        target_env=target_env,
+        target_infra=target_infra,
+        target_group=target_group,
+        target_name=target_name,
+        target_type=target_type,
+        dry_run=dry_run,
+        auto_confirm=auto_confirm,
+        force=force,
+        pull=pull,
     )
-    # Track number of resource groups updated
-    num_rgs_updated = 0
-    num_rgs_to_update = len(resource_groups_to_update)
-    # Track number of resources updated
-    num_resources_updated = 0
-    num_resources_to_update = 0
-
-    if num_rgs_to_update == 0:
-        print_info("No resources to update")
-        return
 
-    logger.debug(f"Updating {num_rgs_to_update} resource groups")
-    for rg in resource_groups_to_update:
-        _num_resources_updated, _num_resources_to_update = rg.update_resources(
-            group_filter=target_group,
-            name_filter=target_name,
-            type_filter=target_type,
-            dry_run=dry_run,
-            auto_confirm=auto_confirm,
-            force=force,
-            pull=pull,
-        )
-        if _num_resources_updated > 0:
-            num_rgs_updated += 1
-        num_resources_updated += _num_resources_updated
-        num_resources_to_update += _num_resources_to_update
-        logger.debug(f"Updated {num_resources_updated} resources in {num_rgs_updated} resource groups")
 
-    if dry_run:
-        return
-
-    if num_resources_updated == 0:
-        return
-
-    print_heading(f"\n--**-- ResourceGroups updated: {num_rgs_updated}/{num_rgs_to_update}\n")
-
-    workspace_event_status = "in_progress"
-    if num_resources_updated == num_resources_to_update:
-        workspace_event_status = "success"
-    else:
-        logger.error("Some resources failed to update, please check logs")
-        workspace_event_status = "failed"
+def delete_workspace(agno_config: AgnoCliConfig, ws_to_delete: Optional[Iterable[Path]]) -> None:
+    num_deleted = 0
+    if ws_to_delete is not None:
+        for ws_root in ws_to_delete:
+            agno_config.delete_ws(ws_root_path=ws_root)
+            num_deleted += 1
 
-    if (
-        agno_config.user is not None
-        and ws_config.ws_schema is not None
-        and ws_config.ws_schema.id_workspace is not None
-    ):
-        # Log workspace start event
-        log_workspace_event(
-            user=agno_config.user,
-            workspace_event=WorkspaceEvent(
-                id_workspace=ws_config.ws_schema.id_workspace,
-                event_type="update",
-                event_status=workspace_event_status,
-                event_data={
-                    "target_env": target_env,
-                    "target_infra": target_infra,
-                    "target_group": target_group,
-                    "target_name": target_name,
-                    "target_type": target_type,
-                    "dry_run": dry_run,
-                    "auto_confirm": auto_confirm,
-                    "force": force,
-                },
-            ),
-        )
-
-
-def delete_workspace(agno_config: AgnoCliConfig, ws_to_delete: Optional[List[Path]]) -> None:
-    if ws_to_delete is None or len(ws_to_delete) == 0:
+    if num_deleted == 0:
         print_heading("No workspaces to delete")
-        return
-
-    for ws_root in ws_to_delete:
-        agno_config.delete_ws(ws_root_path=ws_root)
 
 
 def set_workspace_as_active(ws_dir_name: Optional[str]) -> None:
@@ -722,7 +667,7 @@ def set_workspace_as_active(ws_dir_name: Optional[str]) -> None:
     if ws_dir_name is None:
         # If the user does not provide a ws_name, that implies `ag set` is ran from
         # the workspace directory.
-        ws_root_path = Path(".").resolve()
+        ws_root_path = Path.cwd()
     else:
         # If the user provides a workspace name manually, we find the dir for that ws
         ws_config: Optional[WorkspaceConfig] = agno_config.get_ws_config_by_dir_name(ws_dir_name)
@@ -731,7 +676,8 @@ def set_workspace_as_active(ws_dir_name: Optional[str]) -> None:
             return
         ws_root_path = ws_config.ws_root_path
 
-    ws_dir_is_valid: bool = ws_root_path is not None and ws_root_path.exists() and ws_root_path.is_dir()
+    ws_root_stat = stat_or_none(ws_root_path) if ws_root_path is not None else None
+    ws_dir_is_valid: bool = ws_root_stat is not None and S_ISDIR(ws_root_stat.st_mode)
     if not ws_dir_is_valid:
         logger.error("Invalid workspace directory: {}".format(ws_root_path))
         return
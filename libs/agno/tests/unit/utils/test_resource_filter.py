@@ -0,0 +1,30 @@
+from agno.utils.resource_filter import parse_resource_filter
+
+
+def test_parse_single_filter():
+    assert parse_resource_filter("dev") == ("dev", None, None, None, None)
+
+
+def test_parse_full_filter():
+    assert parse_resource_filter("prd:aws:group:name:type") == ("prd", "aws", "group", "name", "type")
+
+
+def test_parse_partial_filter():
+    assert parse_resource_filter("prd:aws") == ("prd", "aws", None, None, None)
+
+
+def test_parse_filter_with_empty_fields():
+    assert parse_resource_filter("prd:::s3") == ("prd", None, None, "s3", None)
+
+
+def test_parse_empty_filter():
+    assert parse_resource_filter("") == (None, None, None, None, None)
+
+
+def test_parse_filter_is_cached():
+    parse_resource_filter.cache_clear()
+    parse_resource_filter("dev:docker")
+    parse_resource_filter("dev:docker")
+    cache_info = parse_resource_filter.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1